@@ -2,10 +2,63 @@
 
 import os
 import shutil
+import argparse
+import threading
+import queue
+import functools
+import hashlib
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from tqdm import tqdm
 import sys
 
+# File moves are I/O-bound, so a handful of threads overlap their waits
+DEFAULT_WORKERS = 8
+
+# Files buffered between the directory scanner and the movers; bounds memory
+QUEUE_SIZE = 4096
+
+# Each worker reports progress in steps of this many files
+PROGRESS_STEP = 256
+
+# Distinct suffixes remembered by the scanner; extensions repeat heavily
+EXT_CACHE_SIZE = 4096
+
+# Flags used to reserve a destination name before moving a file onto it
+RESERVE_FLAGS = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, "O_BINARY", 0)
+
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+
+    MOVEFILE_REPLACE_EXISTING = 0x1
+    MOVEFILE_COPY_ALLOWED = 0x2
+    MOVEFILE_WRITE_THROUGH = 0x8
+
+    _MoveFileExW = ctypes.WinDLL("kernel32", use_last_error=True).MoveFileExW
+    _MoveFileExW.argtypes = (wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.DWORD)
+    _MoveFileExW.restype = wintypes.BOOL
+
+    def move_file_native(source, destination, flags=MOVEFILE_REPLACE_EXISTING):
+        """Move a file with a single MoveFileExW call (Windows only)."""
+        if not _MoveFileExW(source, destination, flags):
+            raise ctypes.WinError(ctypes.get_last_error())
+
+def collision_tag(path):
+    """Short hash of a file's identity, used to rename it on a name conflict.
+
+    Hashing the inode and modification time gives a unique suffix in one
+    step instead of probing name_1, name_2, ... for every clash.
+    """
+    st = os.lstat(path)
+    key = f"{st.st_ino}:{st.st_mtime_ns}".encode()
+    return hashlib.blake2b(key, digest_size=4).hexdigest()
+
+# Windows and macOS filesystems are case-insensitive by default, so names
+# are compared case-folded there when checking for conflicts
+name_key = str.casefold if sys.platform in ("win32", "darwin") else str
+
 def create_directory(directory_path):
     """Create directory if it doesn't exist."""
     try:
@@ -31,83 +84,382 @@ def get_valid_path(prompt, check_exists=True):
             
         return path
 
-def get_files_from_target(target_path):
-    """Get a list of files (not directories) from the target path."""
-    files = []
+class FileRec:
+    """A file found in the target directory.
+
+    Records are recycled through a free list once a worker is done with
+    them, so a long run allocates about as many records as the queue holds.
+    """
+    __slots__ = ('path', 'name', 'stem', 'suffix', 'ext')
+
+def scan_files(target_path, skip_hidden=False, free_records=None):
+    """Yield files (not directories) in the target path as they are listed.
+
+    Each file is a FileRec, taken from free_records when one is available.
+    DirEntry.is_file() answers from the d_type reported by the directory
+    listing, so no stat() is needed per entry on filesystems that fill it
+    in (ext4, xfs, btrfs, tmpfs, ...). Where d_type is DT_UNKNOWN, and for
+    symlinks, it still has to stat. Symlinks are kept unless they point to a
+    directory: files are moved while the listing runs, so a link's target
+    may already be gone by the time the link is listed. Hidden (dot) files
+    are dropped on their name alone when skip_hidden is set.
+    """
+    if free_records is None:
+        free_records = deque()
     
-    try:
-        # Only consider files in the root directory, ignore subdirectories
-        for item in os.listdir(target_path):
-            item_path = Path(target_path) / item
-            if item_path.is_file():
-                files.append(item_path)
-    except Exception as e:
-        print(f"Error accessing target directory: {e}")
-        sys.exit(1)
-        
-    return files
+    # Each distinct suffix is lowercased once, then looked up. The set of
+    # extensions is only known once the listing ends, and one dict probe is
+    # cheaper than a call into a function generated for a fixed set
+    ext_cache = {}
+    
+    # This loop runs once per directory entry, so the name splitting is
+    # inlined and method lookups are bound to locals to keep interpreter
+    # work down
+    cached_ext = ext_cache.get
+    reuse_record = free_records.pop
+    
+    # Only consider files in the root directory, ignore subdirectories
+    with os.scandir(target_path) as it:
+        for entry in it:
+            name = entry.name
+            if skip_hidden and name[0] == '.':
+                continue
+            if entry.is_file() or (entry.is_symlink() and not entry.is_dir()):
+                try:
+                    file = reuse_record()
+                except IndexError:
+                    file = FileRec()
+                file.path = entry.path
+                file.name = name
+                # Split stem and suffix following pathlib's rules
+                dot = name.rfind('.')
+                if 0 < dot < len(name) - 1:
+                    file.stem = name[:dot]
+                    suffix = name[dot:]
+                else:
+                    file.stem = name
+                    suffix = ''
+                file.suffix = suffix
+                ext = cached_ext(suffix)
+                if ext is None:
+                    # Get extension without the dot and convert to lowercase
+                    ext = suffix[1:].lower() if suffix else "no_extension"
+                    if len(ext_cache) < EXT_CACHE_SIZE:
+                        ext_cache[suffix] = ext
+                file.ext = ext
+                yield file
+
+def get_files_from_target(target_path, file_queue, consumers, skip_hidden=False, free_records=None,
+                          stop=None):
+    """Feed files from the target path into file_queue from a background thread.
 
-def get_file_extensions(files):
-    """Extract unique file extensions from a list of files."""
-    extensions = set()
+    The queue is closed with one None per consumer. Consumers hand finished
+    records back through free_records. Listing ends early once the optional
+    stop event is set. Returns the scanner thread and a list that receives
+    the error if listing fails.
+    """
+    errors = []
     
-    for file in files:
-        # Get extension without the dot and convert to lowercase
-        ext = file.suffix[1:].lower() if file.suffix else "no_extension"
-        extensions.add(ext)
-        
-    return extensions
+    def scan():
+        try:
+            for file in scan_files(target_path, skip_hidden, free_records):
+                if stop is not None and stop.is_set():
+                    break
+                file_queue.put(file)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            for _ in range(consumers):
+                file_queue.put(None)
+    
+    scanner = threading.Thread(target=scan, daemon=True)
+    scanner.start()
+    return scanner, errors
+
+def is_same_filesystem(path_a, path_b):
+    """Check whether two paths live on the same filesystem (device)."""
+    try:
+        return os.stat(path_a).st_dev == os.stat(path_b).st_dev
+    except OSError:
+        return False
+
+def copy_and_remove(source, destination):
+    """Move a file across filesystems by copying it, then deleting the original.
+
+    shutil.copyfile lets the kernel do the copy where it can (os.sendfile on
+    Linux, fcopyfile on macOS) instead of a Python read/write loop.
+    """
+    shutil.copy2(source, destination, follow_symlinks=False)
+    os.unlink(source)
+
+def move_files(target_path, destination_path, workers=DEFAULT_WORKERS,
+               zero_copy=False, dry_run=False, skip_hidden=False):
+    """Move files from the target path into per-extension directories.
+
+    Files stream from the directory scanner through a bounded queue to a
+    pool of worker threads, so moving starts while the listing is still
+    running and memory use depends on the queue size, not the number of
+    files. Each extension directory is created the first time a worker
+    sees that extension.
+
+    When source and destination share a filesystem each move is a single
+    os.rename (a directory entry update, no data copied). Otherwise
+    shutil.move falls back to copying the file and removing the original,
+    or copy_and_remove is used directly when zero_copy is set. On Windows
+    every move is one MoveFileExW call instead. Where the platform supports
+    it, same-filesystem moves work on names relative to open handles of the
+    target and extension directories, so the kernel does not resolve the
+    full paths again for every file. A dry run resolves every destination
+    name but leaves the files where they are.
+
+    On Ctrl-C the scanner and workers stop after the file in hand, so no
+    move is left half done, and the KeyboardInterrupt is re-raised.
 
-def create_extension_directories(destination_path, extensions):
-    """Create directories for each file extension."""
-    created_dirs = {}
+    Returns (moved_files, skipped_files, ext_counts, extension_dirs).
+    """
+    # Fast path: same-filesystem moves never need to copy any data
+    same_filesystem = is_same_filesystem(target_path, destination_path)
+    if sys.platform == "win32":
+        # Call MoveFileExW directly; across volumes it copies natively
+        flags = MOVEFILE_REPLACE_EXISTING
+        if not same_filesystem:
+            flags |= MOVEFILE_COPY_ALLOWED | MOVEFILE_WRITE_THROUGH
+        move = functools.partial(move_file_native, flags=flags)
+    elif same_filesystem:
+        move = os.rename
+    elif zero_copy:
+        move = copy_and_remove
+    else:
+        move = shutil.move
     
-    print("Creating extension directories...")
-    for ext in tqdm(extensions, desc="Creating directories"):
-        dir_path = Path(destination_path) / ext
-        if create_directory(dir_path):
-            created_dirs[ext] = dir_path
+    # Open directory handles let renames skip the per-file path walk
+    use_dir_fds = (same_filesystem and not dry_run and sys.platform != "win32"
+                   and os.rename in os.supports_dir_fd and os.open in os.supports_dir_fd)
+    src_dir_fd = os.open(target_path, os.O_RDONLY | os.O_DIRECTORY) if use_dir_fds else None
+    
+    # Per-extension state, filled in the first time an extension is seen:
+    # ext -> (prefix, lock, taken names, dir fd or None), or None when the
+    # directory could not be created. Destination prefixes are plain strings
+    # so the hot loop never builds Paths. Taken names are read from disk once
+    # so conflict checks are set lookups instead of a stat() per probe; the
+    # per-extension lock only guards conflict resolution so two workers
+    # never pick the same name.
+    #
+    # Only the dir-ensurer thread writes this state and it publishes a new
+    # dict for every extension it adds. Rebinding a name is atomic, so
+    # workers read the current snapshot without a lock and only wait when
+    # they meet a brand-new extension.
+    ext_state = {}
+    extension_dirs = {}
+    dir_requests = queue.Queue()
+    
+    def ensure_extension_dirs():
+        nonlocal ext_state
+        while True:
+            request = dir_requests.get()
+            if request is None:
+                break
+            ext, ready = request
+            if ext not in ext_state:
+                dir_path = Path(destination_path) / ext
+                try:
+                    if not dry_run:
+                        os.makedirs(dir_path, exist_ok=True)
+                    taken = set(map(name_key, os.listdir(dir_path))) if os.path.isdir(dir_path) else set()
+                    dir_fd = os.open(dir_path, os.O_RDONLY | os.O_DIRECTORY) if use_dir_fds else None
+                    state = (str(dir_path) + os.sep, threading.Lock(), taken, dir_fd)
+                    extension_dirs[ext] = dir_path
+                except Exception as e:
+                    tqdm.write(f"Error creating directory {dir_path}: {e}")
+                    state = None
+                ext_state = {**ext_state, ext: state}
+            ready.set()
+    
+    def claim_name(path, name, stem, suffix, lock, taken):
+        with lock:
+            if name_key(name) not in taken:
+                taken.add(name_key(name))
+                return name
         
-    return created_dirs
-
-def move_files(files, extension_dirs, destination_path):
-    """Move files to their respective extension directories."""
-    moved_files = 0
-    skipped_files = 0
+        # Handle name conflicts, falling back to a counter only if the
+        # hashed name is taken as well
+        tagged_stem = f"{stem}_{collision_tag(path)}"
+        with lock:
+            dest_name = f"{tagged_stem}{suffix}"
+            counter = 1
+            while name_key(dest_name) in taken:
+                dest_name = f"{tagged_stem}_{counter}{suffix}"
+                counter += 1
+            taken.add(name_key(dest_name))
+        return dest_name
     
-    print("Moving files...")
-    for file in tqdm(files, desc="Moving files"):
+    def move_one(file):
+        path, name, stem, suffix, ext = file.path, file.name, file.stem, file.suffix, file.ext
         try:
-            # Get extension without the dot and convert to lowercase
-            ext = file.suffix[1:].lower() if file.suffix else "no_extension"
-            
-            # Skip if directory for this extension wasn't created
-            if ext not in extension_dirs:
-                print(f"Warning: No directory for extension '{ext}', skipping {file.name}")
-                skipped_files += 1
-                continue
-                
-            dest_file = extension_dirs[ext] / file.name
+            state = ext_state[ext]
+        except KeyError:
+            ready = threading.Event()
+            dir_requests.put((ext, ready))
+            ready.wait()
+            state = ext_state[ext]
+        
+        # Skip if directory for this extension wasn't created
+        if state is None:
+            return False
+        prefix, lock, taken, dir_fd = state
+        
+        try:
+            dest_name = claim_name(path, name, stem, suffix, lock, taken)
+            if dry_run:
+                return True
             
-            # Handle name conflicts
-            counter = 1
-            original_stem = file.stem
-            while dest_file.exists():
-                new_name = f"{original_stem}_{counter}{file.suffix}"
-                dest_file = extension_dirs[ext] / new_name
-                counter += 1
+            # The name sets only know what this run has seen; creating the
+            # destination with O_EXCL reserves the name atomically even if
+            # something else writes to the directory meanwhile. The move
+            # then replaces the empty placeholder. With a directory handle
+            # the bare name is resolved against it instead of a full path
+            while True:
+                dest_file = dest_name if dir_fd is not None else prefix + dest_name
+                try:
+                    os.close(os.open(dest_file, RESERVE_FLAGS, 0o644, dir_fd=dir_fd))
+                    break
+                except FileExistsError:
+                    dest_name = claim_name(path, name, stem, suffix, lock, taken)
                 
             # Move the file
-            shutil.move(str(file), str(dest_file))
-            moved_files += 1
+            reserved = True
+            try:
+                if dir_fd is not None:
+                    os.rename(name, dest_name, src_dir_fd=src_dir_fd, dst_dir_fd=dir_fd)
+                else:
+                    try:
+                        move(path, dest_file)
+                    except FileExistsError:
+                        # Symlinks are recreated rather than copied across
+                        # filesystems, which cannot replace the placeholder
+                        os.unlink(dest_file)
+                        reserved = False
+                        move(path, dest_file)
+            except Exception:
+                if reserved:
+                    try:
+                        os.unlink(dest_file, dir_fd=dir_fd)
+                    except OSError:
+                        pass
+                raise
+            return True
             
         except Exception as e:
-            print(f"Error moving file {file}: {e}")
-            skipped_files += 1
-            
-    return moved_files, skipped_files
+            tqdm.write(f"Error moving file {path}: {e}")
+            return False
+    
+    def worker():
+        moved = skipped = pending = 0
+        ext_counts = Counter()
+        while True:
+            file = file_queue.get()
+            if file is None or stop.is_set():
+                break
+            ext_counts[file.ext] += 1
+            if move_one(file):
+                moved += 1
+            else:
+                skipped += 1
+            free_records.append(file)
+            pending += 1
+            if pending == PROGRESS_STEP:
+                progress.update(pending)
+                pending = 0
+        progress.update(pending)
+        return moved, skipped, ext_counts
+    
+    file_queue = queue.Queue(maxsize=QUEUE_SIZE)
+    # Only the scanner pops and only workers append, so no lock is needed
+    free_records = deque()
+    # Set on Ctrl-C so the scanner and workers wind down
+    stop = threading.Event()
+    
+    print("Moving files...")
+    # The total is unknown until the listing ends; the bar counts files instead
+    try:
+        with tqdm(desc="Moving files", unit="file", mininterval=0.5) as progress:
+            dir_ensurer = threading.Thread(target=ensure_extension_dirs, daemon=True)
+            dir_ensurer.start()
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(worker) for _ in range(workers)]
+                scanner, errors = get_files_from_target(target_path, file_queue, workers,
+                                                        skip_hidden, free_records, stop)
+                try:
+                    results = [future.result() for future in futures]
+                except KeyboardInterrupt:
+                    # Leaving the with block waits for the workers, so
+                    # they must be told to stop first
+                    stop.set()
+                    executor.shutdown(cancel_futures=True)
+                    raise
+            scanner.join()
+            dir_requests.put(None)
+            dir_ensurer.join()
+    finally:
+        if use_dir_fds:
+            os.close(src_dir_fd)
+            for state in ext_state.values():
+                if state is not None:
+                    os.close(state[3])
+    
+    if errors:
+        print(f"Error accessing target directory: {errors[0]}")
+        sys.exit(1)
+    
+    moved_files = sum(moved for moved, _, _ in results)
+    skipped_files = sum(skipped for _, skipped, _ in results)
+    ext_counts = sum((counts for _, _, counts in results), Counter())
+    return moved_files, skipped_files, ext_counts, extension_dirs
+
+def parse_arguments():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Scout File Organizer - Organize files by extension.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    
+    parser.add_argument(
+        "--workers",
+        dest="workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help="Number of worker threads used to move files"
+    )
+    
+    parser.add_argument(
+        "--zero-copy",
+        dest="zero_copy",
+        action="store_true",
+        default=False,
+        help="Copy cross-device moves in the kernel (sendfile) and delete the originals"
+    )
+    
+    parser.add_argument(
+        "--skip-hidden",
+        dest="skip_hidden",
+        action="store_true",
+        default=False,
+        help="Leave hidden (dot) files in the target directory"
+    )
+    
+    parser.add_argument(
+        "--dry-run",
+        dest="dry_run",
+        action="store_true",
+        default=False,
+        help="Plan the reorganization without creating directories or moving files"
+    )
+    
+    return parser.parse_args()
 
 def main():
+    args = parse_arguments()
+    
     print("=== Scout File Organizer ===")
     print("This tool will organize files by extension from a source directory to a destination directory.")
     
@@ -116,32 +468,35 @@ def main():
     destination_path = get_valid_path("Enter destination directory path: ", check_exists=False)
     
     # Create destination directory if it doesn't exist
-    if not create_directory(destination_path):
+    if not args.dry_run and not create_directory(destination_path):
         print("Failed to create destination directory. Exiting.")
         sys.exit(1)
     
-    # Get files from target directory
-    files = get_files_from_target(target_path)
+    # Move files to their respective directories as they are found
+    moved_files, skipped_files, ext_counts, extension_dirs = move_files(
+        target_path, destination_path,
+        workers=max(1, args.workers),
+        zero_copy=args.zero_copy,
+        dry_run=args.dry_run,
+        skip_hidden=args.skip_hidden
+    )
+    total_files = moved_files + skipped_files
     
-    if not files:
+    if not total_files:
         print("No files found in the target directory.")
         sys.exit(0)
-        
-    print(f"Found {len(files)} files to organize.")
-    
-    # Get unique file extensions
-    extensions = get_file_extensions(files)
-    print(f"Found {len(extensions)} unique file extensions.")
-    
-    # Create directories for each extension
-    extension_dirs = create_extension_directories(destination_path, extensions)
-    
-    # Move files to their respective directories
-    moved_files, skipped_files = move_files(files, extension_dirs, destination_path)
     
     # Print summary
     print("\n=== Summary ===")
-    print(f"Total files processed: {len(files)}")
+    print(f"Total files processed: {total_files}")
+    if args.dry_run:
+        print(f"Files that would be moved: {moved_files}")
+        print(f"Files that would be skipped: {skipped_files}")
+        for ext in sorted(extension_dirs):
+            print(f"  {ext}: {ext_counts[ext]} files -> {extension_dirs[ext]}")
+        print("\nDry run complete, no files were moved.")
+        return
+    
     print(f"Files successfully moved: {moved_files}")
     print(f"Files skipped: {skipped_files}")
     print(f"Extensions organized: {len(extension_dirs)}")
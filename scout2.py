@@ -1,43 +1,122 @@
 #!/usr/bin/env python3
 
 import os
+import sys
+import errno
+import stat
 import shutil
 import json
 import logging
+import logging.handlers
+import queue
+import atexit
 import argparse
 import threading
-import queue
 import time
 import csv
 import platform
+import functools
 from enum import Enum
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Optional, Union, Any, Callable
-from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Set, Tuple, Optional, Union, Any, Callable, Sequence, Iterable, Iterator, Deque
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from array import array
+from operator import attrgetter
 
 try:
     from tqdm import tqdm
-    from colorama import init, Fore, Style
+    from tqdm.contrib.logging import logging_redirect_tqdm
+    from colorama import init, deinit, Fore, Style
     init(autoreset=True)  # Initialize colorama
 except ImportError:
     print("Required packages not found. Please run: pip install -r requirements.txt")
     exit(1)
 
-# Set up logging
+try:
+    import liburing  # Optional: batched renames through io_uring on Linux
+except ImportError:
+    liburing = None
+
+try:
+    import orjson  # Optional: faster JSON reports
+except ImportError:
+    orjson = None
+
+# Set up logging; the console only shows warnings and errors, the log file gets everything.
+# The filter (unlike the level) is carried over when logging_redirect_tqdm swaps the handler.
+# LOGLEVEL=DEBUG in the environment lowers the level for the log file.
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+console_handler = logging.StreamHandler()
+console_handler.setLevel(logging.WARNING)
+console_handler.addFilter(lambda record: record.levelno >= logging.WARNING)
+
+# Records for the log file are queued and written by a background thread,
+# so workers never wait on the file; the listener adds the timestamp etc.
+file_handler = logging.FileHandler("scout.log")
+file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+log_queue = queue.SimpleQueue()
+queue_handler = logging.handlers.QueueHandler(log_queue)
+queue_handler.setFormatter(logging.Formatter('%(message)s'))
+log_listener = logging.handlers.QueueListener(log_queue, file_handler)
+log_listener.start()
+atexit.register(log_listener.stop)
+
+# An unknown LOGLEVEL falls back to INFO instead of failing at import;
+# getLevelName maps a known name to its number and anything else to a string
+LOG_LEVEL = os.environ.get("LOGLEVEL", "INFO").upper()
+log_level_valid = isinstance(logging.getLevelName(LOG_LEVEL), int)
+
 logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    level=LOG_LEVEL if log_level_valid else logging.INFO,
+    format=LOG_FORMAT,
     handlers=[
-        logging.FileHandler("scout.log"),
-        logging.StreamHandler()
+        queue_handler,
+        console_handler
     ]
 )
 logger = logging.getLogger("Scout2")
+if not log_level_valid:
+    logger.warning(f"Unknown LOGLEVEL {LOG_LEVEL!r}, using INFO")
 
 # Disable verbose logging for file operations
 logging.getLogger("filelock").setLevel(logging.WARNING)
 
+# io_uring submission queue depth and number of renames submitted per batch
+URING_QUEUE_DEPTH = 256
+URING_BATCH_SIZE = 128
+# First kernel with IORING_OP_RENAMEAT
+URING_MIN_KERNEL = (5, 11)
+# Smaller chunks are moved one by one; setting up a ring costs more than it saves
+MIN_BATCH_FOR_URING = 8
+
+# Extension directories are only created from a thread pool when there are more than this many
+MKDIR_POOL_THRESHOLD = 4
+
+# Failed operations kept for the report; every failure is still logged
+FAILURE_SAMPLE_SIZE = 20
+
+# The confirmation prompt counts files up to this many, then shows "N+"
+QUICK_COUNT_LIMIT = 10000
+
+# Files handed to a worker at a time while the target is still being listed
+STREAM_CHUNK_SIZE = 256
+
+# Buffer size for copies the kernel cannot do by itself
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# Flags for creating an empty placeholder that reserves a destination name
+RESERVE_FLAGS = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, "O_BINARY", 0)
+
+# Errors meaning an in-kernel copy call is not usable for this pair of files
+KERNEL_COPY_ERRNOS = (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.ENOTSUP, errno.EOPNOTSUPP)
+
+# sendfile only accepts a regular file as its output on Linux; BSD and
+# macOS require a socket (same guard as shutil's _USE_CP_SENDFILE)
+USE_SENDFILE = hasattr(os, "sendfile") and sys.platform.startswith("linux")
+
 
 class OperationMode(Enum):
     """Enum for file operation modes."""
@@ -52,31 +131,390 @@ class SortMode(Enum):
     DEEPFREEZE = "deepfreeze"
 
 
+def split_suffix(name: str) -> Tuple[str, str]:
+    """Split a file name into stem and suffix following pathlib's rules."""
+    dot = name.rfind('.')
+    if 0 < dot < len(name) - 1:
+        return name[:dot], name[dot:]
+    return name, ""
+
+
+def kernel_version() -> Tuple[int, int]:
+    """Return the running kernel's (major, minor) version, or (0, 0) if it cannot be parsed."""
+    try:
+        major, minor = platform.release().split('.')[:2]
+        return int(major), int(minor.split('-')[0].split('+')[0])
+    except ValueError:
+        return 0, 0
+
+
+# One copy buffer per thread, reused for every file that thread copies
+_copy_buffers = threading.local()
+
+
+def _copy_buffer() -> memoryview:
+    """Return the calling thread's copy buffer, allocating it on first use."""
+    buffer = getattr(_copy_buffers, "view", None)
+    if buffer is None:
+        buffer = _copy_buffers.view = memoryview(bytearray(COPY_BUFFER_SIZE))
+    return buffer
+
+
+def _copyfileobj_mv(fsrc, fdst, buffer: memoryview) -> None:
+    """Copy the rest of fsrc into fdst through a caller-owned buffer."""
+    while True:
+        read = fsrc.readinto(buffer)
+        if not read:
+            break
+        view = buffer[:read]
+        while view:
+            view = view[fdst.write(view):]
+
+
+def is_rotational(path: Path) -> Optional[bool]:
+    """Report whether the disk holding path spins, or None if it cannot be told (non-Linux, tmpfs, ...)."""
+    if platform.system() != "Linux":
+        return None
+    try:
+        dev = os.stat(path).st_dev
+        # Partitions have no queue/ of their own; it lives on the parent disk
+        block_dir = f"/sys/dev/block/{os.major(dev)}:{os.minor(dev)}"
+        for queue_dir in (block_dir, os.path.join(block_dir, "..")):
+            flag_path = os.path.join(queue_dir, "queue", "rotational")
+            if os.path.exists(flag_path):
+                with open(flag_path) as f:
+                    return f.read().strip() == "1"
+    except OSError:
+        pass
+    return None
+
+
+def _fast_copy(source: str, destination: str) -> None:
+    """
+    Copy a file's data and metadata, keeping the data in the kernel where possible.
+    
+    Tries copy_file_range (which can reflink on copy-on-write filesystems),
+    then sendfile on Linux, then a read/write loop through the thread's 1 MiB
+    buffer. Files are opened unbuffered since that buffer is the only one
+    needed. The destination is created with O_EXCL, so an existing file is
+    never overwritten; a partial copy is removed if anything fails.
+    
+    Raises:
+        shutil.SpecialFileError: If the source is not a regular file
+    """
+    # Refuse FIFOs, sockets and devices before open() can block on them
+    if not stat.S_ISREG(os.stat(source).st_mode):
+        raise shutil.SpecialFileError(f"`{source}` is not a regular file")
+    
+    with open(source, 'rb', buffering=0) as fsrc:
+        with open(destination, 'xb', buffering=0) as fdst:
+            try:
+                in_fd = fsrc.fileno()
+                out_fd = fdst.fileno()
+                size = os.fstat(in_fd).st_size
+                offset = 0
+                
+                if hasattr(os, "copy_file_range"):
+                    try:
+                        while offset < size:
+                            copied = os.copy_file_range(in_fd, out_fd, size - offset)
+                            if not copied:
+                                break
+                            offset += copied
+                    except OSError as e:
+                        if e.errno not in KERNEL_COPY_ERRNOS:
+                            raise
+                
+                if offset < size and USE_SENDFILE:
+                    try:
+                        while offset < size:
+                            copied = os.sendfile(out_fd, in_fd, offset, size - offset)
+                            if not copied:
+                                break
+                            offset += copied
+                    except OSError as e:
+                        if e.errno not in KERNEL_COPY_ERRNOS:
+                            raise
+                
+                # Whatever is left (or everything, without kernel copy support)
+                fsrc.seek(offset)
+                _copyfileobj_mv(fsrc, fdst, _copy_buffer())
+            except BaseException:
+                fdst.close()
+                os.unlink(destination)
+                raise
+    
+    shutil.copystat(source, destination)
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_ext(suffix: str) -> str:
+    """
+    Turn a suffix such as '.JPG' into its extension folder name ('jpg').
+    
+    Cached, so each distinct suffix is sliced and lowercased once and every
+    file with that suffix shares one string.
+    """
+    return suffix[1:].lower() or "no_extension"
+
+
+@dataclass
+class ScannedFile:
+    """A file found while scanning, with its extension worked out once."""
+    path: str
+    name: str
+    suffix: str
+    ext: str
+    
+    @classmethod
+    def from_entry(cls, entry: os.DirEntry) -> "ScannedFile":
+        """Build a record from a scandir entry, splitting the suffix like pathlib."""
+        name = entry.name
+        suffix = split_suffix(name)[1]
+        return cls(entry.path, name, suffix, _normalize_ext(suffix))
+
+
 class FileOperation:
     """Class to handle file operations (move/copy) with error handling and rollback capability."""
     
     def __init__(self, mode: OperationMode = OperationMode.MOVE):
         self.mode = mode
-        self.operations_log: List[Tuple[Path, Path]] = []  # Source and destination of each operation
-        self.failed_operations: List[Tuple[Path, Path, Exception]] = []
+        self.operations_log: List[Tuple[str, str]] = []  # Source and destination of each move
+        # The most recent failures as (source, destination, error) strings, and how many there were
+        self.failed_operations: Deque[Tuple[str, str, str]] = deque(maxlen=FAILURE_SAMPLE_SIZE)
+        self.failed_count = 0
+        self._failures_lock = threading.Lock()
+        
+        # Whether each (source dir, destination dir) pair shares a filesystem
+        self._same_device: Dict[Tuple[str, str], bool] = {}
+        # Cleared the first time the filesystem refuses a hard link
+        self._links_supported = os.link in os.supports_follow_symlinks
+        # Cleared the first time io_uring cannot be set up or rejects renames
+        self._uring_supported = (liburing is not None and sys.platform == "linux"
+                                 and kernel_version() >= URING_MIN_KERNEL)
     
-    def perform_operation(self, source: Path, destination: Path) -> bool:
-        """Perform file operation (move or copy) based on the selected mode."""
-        try:
-            if self.mode == OperationMode.MOVE:
-                shutil.move(str(source), str(destination))
-            else:  # COPY mode
-                shutil.copy2(str(source), str(destination))
+    def is_same_device(self, source_dir: Union[str, Path], destination_dir: Union[str, Path]) -> bool:
+        """Check whether two directories are on the same filesystem, statting each pair once."""
+        key = (os.fspath(source_dir), os.fspath(destination_dir))
+        same = self._same_device.get(key)
+        if same is None:
+            try:
+                same = os.stat(key[0]).st_dev == os.stat(key[1]).st_dev
+            except OSError:
+                same = False
+            self._same_device[key] = same
+        return same
+    
+    def perform_operation(self, source: Union[str, Path], destination: Union[str, Path]) -> bool:
+        """
+        Perform file operation (move or copy) based on the selected mode.
+        
+        The destination name is claimed atomically: copies (including moves
+        across filesystems) create it with O_EXCL, and renames first create
+        an empty placeholder that the rename then replaces. Callers can
+        therefore try a name without checking exists() first.
+        
+        Raises:
+            FileExistsError: If the destination already exists
+        """
+        if self.mode == OperationMode.COPY:
+            try:
+                _fast_copy(str(source), str(destination))
+            except FileExistsError:
+                raise
+            except Exception as e:
+                return self._record_failure(source, destination, e)
+        elif self.is_same_device(os.path.dirname(source), os.path.dirname(destination)) or os.path.islink(source):
+            try:
+                os.close(os.open(destination, RESERVE_FLAGS, 0o644))
+            except FileExistsError:
+                raise
+            except Exception as e:
+                return self._record_failure(source, destination, e)
             
-            # Log successful operation
-            self.operations_log.append((source, destination))
-            return True
+            reserved = True
+            try:
+                try:
+                    # One rename syscall, without shutil.move's extra checks
+                    os.replace(str(source), str(destination))
+                except OSError as e:
+                    # Symlinks across filesystems, and bind mounts of the
+                    # same filesystem, which share st_dev but refuse renames
+                    if e.errno != errno.EXDEV:
+                        raise
+                    try:
+                        shutil.move(str(source), str(destination))
+                    except FileExistsError:
+                        # Symlinks are recreated rather than copied across
+                        # filesystems, which cannot replace the placeholder
+                        os.unlink(destination)
+                        reserved = False
+                        shutil.move(str(source), str(destination))
+            except Exception as e:
+                if reserved:
+                    try:
+                        os.unlink(destination)
+                    except OSError:
+                        pass
+                return self._record_failure(source, destination, e)
+        else:
+            # Across filesystems a rename can only fail, so copy straight
+            # away (the O_EXCL create claims the name) and drop the original
+            try:
+                _fast_copy(str(source), str(destination))
+            except FileExistsError:
+                raise
+            except Exception as e:
+                return self._record_failure(source, destination, e)
             
-        except Exception as e:
-            # Log failed operation
-            self.failed_operations.append((source, destination, e))
-            logger.error(f"Failed to {self.mode.value} file {source} to {destination}: {e}")
+            try:
+                os.unlink(source)
+            except OSError as e:
+                # Leave the file where it was rather than in both places
+                os.unlink(destination)
+                return self._record_failure(source, destination, e)
+        
+        # Log successful operation
+        self.log_operation(source, destination)
+        return True
+    
+    def log_operation(self, source: Union[str, Path], destination: Union[str, Path]) -> None:
+        """
+        Remember a completed operation for rollback.
+        
+        Only moves are recorded, since copies are never rolled back, and
+        paths are kept as plain strings, which take far less memory than
+        Path objects on large runs.
+        """
+        if self.mode == OperationMode.MOVE:
+            self.operations_log.append((os.fspath(source), os.fspath(destination)))
+    
+    def note_failure(self, source: Union[str, Path], destination: Union[str, Path], error: Exception) -> None:
+        """
+        Count a failed operation and keep it in the bounded sample shown in the report.
+        
+        Only strings are kept, so the exception (and the frames its
+        traceback holds on to) can be freed.
+        """
+        with self._failures_lock:
+            self.failed_count += 1
+            self.failed_operations.append((os.fspath(source), os.fspath(destination), str(error)))
+    
+    def _record_failure(self, source: Union[str, Path], destination: Union[str, Path], error: Exception) -> bool:
+        """Log a failed operation and return False."""
+        self.note_failure(source, destination, error)
+        logger.error(f"Failed to {self.mode.value} file {source} to {destination}: {error}")
+        return False
+    
+    def can_link_move(self, source_dir: Union[str, Path], destination_dir: Path) -> bool:
+        """Check whether a move between two directories can go through perform_link_move."""
+        return (self.mode == OperationMode.MOVE and self._links_supported
+                and self.is_same_device(source_dir, destination_dir))
+    
+    def perform_link_move(self, source: Union[str, Path], destination: Union[str, Path]) -> Optional[bool]:
+        """
+        Move a file within one filesystem by hard-linking it and removing the source.
+        
+        Unlike a rename, creating the link fails when the destination name is
+        taken, so callers can claim a name without checking exists() first.
+        
+        Raises:
+            FileExistsError: If the destination already exists
+            
+        Returns:
+            True on success, False if the move failed, or None if the
+            filesystem does not support hard links
+        """
+        try:
+            os.link(source, destination, follow_symlinks=False)
+        except FileExistsError:
+            raise
+        except OSError as e:
+            if e.errno in (errno.EPERM, errno.EOPNOTSUPP, errno.ENOTSUP, errno.EMLINK, errno.EXDEV):
+                self._links_supported = False
+                return None
+            return self._record_failure(source, destination, e)
+        
+        try:
+            os.unlink(source)
+        except OSError as e:
+            # Leave the file where it was rather than in both places
+            os.unlink(destination)
+            return self._record_failure(source, destination, e)
+        
+        self.log_operation(source, destination)
+        return True
+    
+    def can_batch_renames(self, source_dir: Union[str, Path], destination_dir: Path) -> bool:
+        """Check whether moves between two directories can be batched through io_uring."""
+        if not self._uring_supported or self.mode != OperationMode.MOVE:
             return False
+        return self.is_same_device(source_dir, destination_dir)
+    
+    def perform_batch(self, pairs: List[Tuple[Union[str, Path], Union[str, Path]]]) -> List[bool]:
+        """
+        Rename files in batches through io_uring.
+        
+        Only meant for MOVE mode with source and destination on the same
+        filesystem. Each batch is submitted and reaped with a single
+        io_uring_enter call instead of one rename syscall per file. Renames
+        use RENAME_NOREPLACE so existing files are never overwritten; pairs
+        that fail here are not recorded as failures and should be retried
+        through perform_operation.
+        
+        Args:
+            pairs: (source, destination) paths to rename
+            
+        Returns:
+            One flag per pair, True where the rename succeeded
+        """
+        done = [False] * len(pairs)
+        ring = liburing.Ring()
+        cqe = liburing.Cqe()
+        
+        try:
+            try:
+                liburing.io_uring_queue_init(
+                    URING_QUEUE_DEPTH, ring,
+                    liburing.IORING_SETUP_SINGLE_ISSUER | liburing.IORING_SETUP_COOP_TASKRUN
+                )
+            except OSError:
+                # Older kernels reject the setup flags
+                liburing.io_uring_queue_init(URING_QUEUE_DEPTH, ring)
+        except OSError as e:
+            logger.warning(f"io_uring unavailable, moving files one at a time: {e}")
+            self._uring_supported = False
+            return done
+        
+        try:
+            for start in range(0, len(pairs), URING_BATCH_SIZE):
+                # The kernel reads the path strings after submission, so they
+                # have to stay referenced until the batch completes
+                batch = [(os.fspath(src), os.fspath(dest)) for src, dest in pairs[start:start + URING_BATCH_SIZE]]
+                for offset, (src, dest) in enumerate(batch):
+                    sqe = liburing.io_uring_get_sqe(ring)
+                    liburing.io_uring_prep_rename(sqe, src, dest, liburing.RENAME_NOREPLACE)
+                    liburing.io_uring_sqe_set_data64(sqe, start + offset)
+                liburing.io_uring_submit_and_wait(ring, len(batch))
+                
+                for _ in batch:
+                    liburing.io_uring_wait_cqe(ring, cqe)
+                    entry = cqe[0]
+                    index = entry.user_data
+                    try:
+                        entry.res  # Raises OSError if the rename failed
+                        done[index] = True
+                        self.log_operation(*pairs[index])
+                    except OSError as e:
+                        if e.errno in (errno.EINVAL, errno.EOPNOTSUPP):
+                            # The kernel does not support renames here
+                            self._uring_supported = False
+                    finally:
+                        liburing.io_uring_cq_advance(ring, 1)
+        finally:
+            liburing.io_uring_queue_exit(ring)
+        
+        return done
     
     def rollback(self) -> Tuple[int, int]:
         """Attempt to rollback all operations in case of failure."""
@@ -88,8 +526,8 @@ class FileOperation:
             # Reverse operations log to undo in reverse order
             for source, destination in reversed(self.operations_log):
                 try:
-                    if destination.exists():
-                        shutil.move(str(destination), str(source))
+                    if os.path.lexists(destination):
+                        shutil.move(destination, source)
                         successful_rollbacks += 1
                 except Exception as e:
                     logger.error(f"Rollback failed for {destination} to {source}: {e}")
@@ -114,15 +552,22 @@ class ReportGenerator:
                        destination_path: Path,
                        operation_mode: OperationMode,
                        sort_mode: SortMode,
-                       failed_operations: List[Tuple[Path, Path, Exception]] = None,
+                       failed_operations: Sequence[Tuple[str, str, str]] = (),
+                       failed_count: Optional[int] = None,
                        folders_moved: int = 0) -> str:
-        """Generate a report of the organization operation."""
-        self.end_time = datetime.now()
-        duration = self.end_time - self.start_time
+        """
+        Generate a report of the organization operation.
+        
+        failed_operations may be a sample of the most recent failures, in
+        which case failed_count gives the total.
+        """
+        # One clock reading for the duration, timestamp and file name
+        self.end_time = end_time = datetime.now()
+        duration = end_time - self.start_time
         
         # Basic report data
         report_data = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": end_time.isoformat(),
             "duration_seconds": duration.total_seconds(),
             "operation_mode": operation_mode.value,
             "sort_mode": sort_mode.value,
@@ -133,30 +578,35 @@ class ReportGenerator:
             "files_skipped": skipped_files,
             "folders_moved": folders_moved,
             "extensions_list": sorted(list(extensions_found)),
-            "failed_operations": [(str(src), str(dest), str(err)) 
-                                 for src, dest, err in (failed_operations or [])]
+            "failed_operations_count": len(failed_operations) if failed_count is None else failed_count,
+            "failed_operations": [(str(src), str(dest), str(err))
+                                 for src, dest, err in failed_operations]
         }
         
         # Generate report based on format
         if self.output_format == "json":
-            return self._generate_json_report(report_data)
+            return self._generate_json_report(report_data, end_time)
         elif self.output_format == "csv":
-            return self._generate_csv_report(report_data)
+            return self._generate_csv_report(report_data, end_time)
         else:  # Default to console
             return self._generate_console_report(report_data)
     
-    def _generate_json_report(self, report_data: Dict) -> str:
+    def _generate_json_report(self, report_data: Dict, end_time: datetime) -> str:
         """Generate a JSON report and save to file."""
-        filename = f"scout_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        filename = f"scout_report_{end_time.strftime('%Y%m%d_%H%M%S')}.json"
         
-        with open(filename, 'w') as f:
-            json.dump(report_data, f, indent=2)
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(report_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(report_data, f, indent=2)
         
         return f"Report saved to {filename}"
     
-    def _generate_csv_report(self, report_data: Dict) -> str:
+    def _generate_csv_report(self, report_data: Dict, end_time: datetime) -> str:
         """Generate a CSV report and save to file."""
-        filename = f"scout_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        filename = f"scout_report_{end_time.strftime('%Y%m%d_%H%M%S')}.csv"
         
         # Flatten the data for CSV
         flattened_data = {
@@ -171,7 +621,7 @@ class ReportGenerator:
             "Folders Moved/Copied": report_data["folders_moved"],
             "Files Skipped": report_data["files_skipped"],
             "Extensions": ", ".join(report_data["extensions_list"]),
-            "Failed Operations": len(report_data["failed_operations"])
+            "Failed Operations": report_data["failed_operations_count"]
         }
         
         with open(filename, 'w', newline='') as f:
@@ -227,8 +677,8 @@ class ReportGenerator:
         if report_data["files_skipped"] > 0:
             report.append(f"  {Fore.RED}✗ Files skipped:{Style.RESET_ALL} {report_data['files_skipped']}")
         
-        if report_data["failed_operations"]:
-            report.append(f"  {Fore.RED}✗ Failed operations:{Style.RESET_ALL} {len(report_data['failed_operations'])}")
+        if report_data["failed_operations_count"]:
+            report.append(f"  {Fore.RED}✗ Failed operations:{Style.RESET_ALL} {report_data['failed_operations_count']}")
         
         report.extend([
             f"",
@@ -245,8 +695,9 @@ class ReportGenerator:
             for src, dest, err in report_data["failed_operations"][:5]:  # Show max 5 failures
                 report.append(f"  {Fore.RED}✗{Style.RESET_ALL} {src} → {dest}: {err}")
                 
-            if len(report_data["failed_operations"]) > 5:
-                report.append(f"  ... and {len(report_data['failed_operations']) - 5} more")
+            shown = min(5, len(report_data["failed_operations"]))
+            if report_data["failed_operations_count"] > shown:
+                report.append(f"  ... and {report_data['failed_operations_count'] - shown} more")
                 
             report.append(f"  See log file for complete details.")
         
@@ -269,6 +720,10 @@ class UIManager:
             global Fore, Style
             Fore.GREEN = Fore.RED = Fore.YELLOW = Fore.CYAN = Fore.WHITE = ""
             Style.RESET_ALL = ""
+            # With nothing to translate, give print, tqdm and logging the
+            # plain streams back instead of colorama's per-write wrappers
+            deinit()
+            console_handler.setStream(sys.stderr)
     
     def get_path_input(self, prompt: str, check_exists: bool = True) -> Path:
         """Get a valid path from user input with colored prompts."""
@@ -353,13 +808,23 @@ class UIManager:
             else:
                 print(f"{Fore.RED}Invalid choice. Please enter 1, 2, or 3.{Style.RESET_ALL}")
     
-    def create_progress_bar(self, total: int, desc: str) -> tqdm:
-        """Create a tqdm progress bar with appropriate styling."""
+    def create_progress_bar(self, total: Optional[int], desc: str) -> tqdm:
+        """
+        Create a tqdm progress bar with appropriate styling.
+        
+        Redraws are limited to one per 0.2 s and 64 files, without rate
+        smoothing, and the bar is not drawn at all when stderr is redirected
+        (callers print a summary line instead).
+        """
         return tqdm(
             total=total,
             desc=f"{Fore.CYAN}{desc}{Style.RESET_ALL}",
             unit="file",
-            bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]"
+            bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]",
+            mininterval=0.2,
+            miniters=64,
+            smoothing=0,
+            disable=not sys.stderr.isatty()
         )
     
     def print_welcome(self) -> None:
@@ -469,9 +934,12 @@ class ScoutConfig:
 class FileOrganizer:
     """Main file organizer class that handles the organization process."""
     
-    def __init__(self, ui_manager: UIManager, config: ScoutConfig):
+    def __init__(self, ui_manager: UIManager, config: ScoutConfig, workers: Optional[int] = None,
+                 confirm: bool = True, dry_run: bool = False):
         self.ui_manager = ui_manager
         self.config = config
+        self.confirm = confirm  # Ask before moving files
+        self.dry_run = dry_run  # Only list files and report what would happen
         self.file_op = FileOperation()
         self.report_generator = ReportGenerator()
         
@@ -481,47 +949,213 @@ class FileOrganizer:
         self.moved_files = 0
         self.skipped_files = 0
         
-        # Worker queue and threading
-        self.work_queue: queue.Queue = queue.Queue()
-        self.worker_count = min(32, (os.cpu_count() or 4) * 2)  # 2x CPU cores, max 32
-        self.completion_event = threading.Event()
+        # Thread pool size; picked per run unless given explicitly
+        self.workers_override = workers
+        self.worker_count = workers or min(8, os.cpu_count() or 4)
+    
+    def choose_worker_count(self, target_path: Path, destination_path: Path) -> int:
+        """Choose a thread count suited to the operation mode and destination disk."""
+        if self.file_op.mode == OperationMode.MOVE and self.file_op.is_same_device(target_path, destination_path):
+            # Renames only touch metadata; more threads just contend in the kernel
+            return 2
+        
+        rotational = is_rotational(destination_path)
+        if rotational is None:
+            return min(8, os.cpu_count() or 4)
+        # Spinning disks seek between concurrent copies; SSDs want deep queues
+        return 4 if rotational else 16
+    
+    def quick_count(self, target_path: Path, sort_mode: SortMode, limit: int = QUICK_COUNT_LIMIT) -> int:
+        """
+        Count the files a run would pick up, stopping once the count reaches limit.
+        
+        Used for the confirmation prompt, so answering it never waits for a
+        full listing of a huge tree. Unreadable directories are skipped.
+        
+        Returns:
+            The number of files, or limit if there are at least that many
+        """
+        count = 0
+        pending = [os.fspath(target_path)]
+        while pending and count < limit:
+            try:
+                with os.scandir(pending.pop()) as it:
+                    for entry in it:
+                        if entry.is_dir():
+                            if sort_mode == SortMode.DEEP and not entry.is_symlink():
+                                pending.append(entry.path)
+                        elif sort_mode == SortMode.DEEP or entry.is_file() or entry.is_symlink():
+                            # Links count even when dangling, as in the listing
+                            count += 1
+                            if count >= limit:
+                                break
+            except OSError:
+                pass
+        return count
     
-    def get_files_from_target(self, target_path: Path, sort_mode: SortMode = SortMode.NORMAL) -> List[Path]:
-        """Get a list of files from the target path, with optional recursive scanning."""
-        files = []
+    def iter_files_from_target(self, target_path: Path, sort_mode: SortMode = SortMode.NORMAL,
+                               subdirs: Optional[List[str]] = None,
+                               exclude: Optional[Path] = None,
+                               skip_dirs: Optional[Dict[int, int]] = None) -> Iterator[ScannedFile]:
+        """
+        Yield files from the target path as they are listed, with optional recursive scanning.
+        
+        Uses os.scandir, whose entries carry the file type reported by the
+        directory listing, so is_file()/is_dir() need no stat() per entry
+        except for symlinks. Files are yielded straight away so processing
+        can start before the listing is finished.
+        
+        Args:
+            target_path: The directory to scan
+            sort_mode: DeepSort descends into subdirectories
+            subdirs: Outside DeepSort, receives the names of the target's
+                immediate subdirectories, which DeepFreeze moves afterwards
+            exclude: A directory to leave out (the destination, when it sits
+                inside the target, so organized files are not picked up again)
+            skip_dirs: More directories to leave out, as st_ino -> st_dev. It
+                is checked as the walk goes, so process_files can add the
+                extension directories it creates while the listing runs
+                (they appear inside the target when it is the destination)
+        """
+        files_found = 0
         subdirs_processed = 0
+        excluded = None
+        if exclude is not None:
+            try:
+                st = os.stat(exclude)
+                excluded = (st.st_dev, st.st_ino)
+            except OSError:
+                pass
+        
+        def is_excluded(entry: os.DirEntry) -> bool:
+            if excluded is None:
+                return False
+            st = entry.stat()
+            return (st.st_dev, st.st_ino) == excluded
+        
+        def is_skipped(path: str, inode: int) -> bool:
+            # The inode comes free with the listing; stat only on a match
+            if not skip_dirs or inode not in skip_dirs:
+                return False
+            try:
+                return os.stat(path).st_dev == skip_dirs[inode]
+            except OSError:
+                return False
         
         try:
             if sort_mode == SortMode.DEEP:
-                # Recursively walk through all subdirectories
-                for root, dirs, filenames in os.walk(target_path):
-                    subdirs_processed += len(dirs)
-                    root_path = Path(root)
-                    for filename in filenames:
-                        files.append(root_path / filename)
+                # Recursively walk through all subdirectories with an explicit
+                # stack; symlinked directories are listed but not followed
+                root = os.fspath(target_path)
+                pending = [(root, -1)]
+                while pending:
+                    current, inode = pending.pop()
+                    # Checked when the directory is reached rather than when
+                    # it was listed, since it may have been created since
+                    if is_skipped(current, inode):
+                        continue
+                    try:
+                        with os.scandir(current) as it:
+                            for entry in it:
+                                if entry.is_dir():
+                                    subdirs_processed += 1
+                                    if not entry.is_symlink() and not is_excluded(entry):
+                                        pending.append((entry.path, entry.inode()))
+                                else:
+                                    files_found += 1
+                                    yield ScannedFile.from_entry(entry)
+                    except OSError as e:
+                        if current == root:
+                            raise
+                        logger.warning(f"Skipping unreadable directory {current}: {e}")
                 
-                logger.info(f"Found {len(files)} files in {target_path} and {subdirs_processed} subdirectories")
+                logger.info(f"Found {files_found} files in {target_path} and {subdirs_processed} subdirectories")
             else:
                 # Only consider files in the root directory, ignore subdirectories
-                for item in os.listdir(target_path):
-                    item_path = target_path / item
-                    if item_path.is_file():
-                        files.append(item_path)
+                with os.scandir(target_path) as it:
+                    for entry in it:
+                        # A link whose target was already moved is still a
+                        # file to move, not something to drop
+                        if entry.is_file() or (entry.is_symlink() and not entry.is_dir()):
+                            files_found += 1
+                            yield ScannedFile.from_entry(entry)
+                        elif (entry.is_dir() and subdirs is not None and not is_excluded(entry)
+                              and not is_skipped(entry.path, entry.inode())):
+                            subdirs.append(entry.name)
                         
-                logger.info(f"Found {len(files)} files in {target_path}")
+                logger.info(f"Found {files_found} files in {target_path}")
         except Exception as e:
             logger.error(f"Error accessing target directory: {e}")
             raise
-            
-        return files
+    
+    def _copy_tree(self, source: str, destination: str, executor: ThreadPoolExecutor) -> None:
+        """
+        Copy a directory tree into an existing directory, one file per pool task.
         
-    def process_deepfreeze_folders(self, source_path: Path, destination_path: Path) -> int:
+        A stand-in for shutil.copytree that spreads the file copies over the
+        worker pool. The tree is listed first, its subdirectories are created
+        up front, and directory metadata is copied last, once their contents
+        are in place. Like copytree, symlinks are followed.
+        
+        Raises:
+            shutil.Error: With (source, destination, reason) for each failure
+        """
+        dirs = [(source, destination)]
+        copies = []
+        errors = []
+        
+        # List the whole tree before copying anything
+        pending = [(source, destination)]
+        while pending:
+            src_dir, dst_dir = pending.pop()
+            try:
+                with os.scandir(src_dir) as it:
+                    for entry in it:
+                        dst = os.path.join(dst_dir, entry.name)
+                        if entry.is_dir():
+                            dirs.append((entry.path, dst))
+                            pending.append((entry.path, dst))
+                        else:
+                            copies.append((entry.path, dst))
+            except OSError as e:
+                errors.append((src_dir, dst_dir, str(e)))
+        
+        def make_dir(pair: Tuple[str, str]) -> None:
+            os.makedirs(pair[1], exist_ok=True)
+        
+        for (src, dst), future in zip(dirs, [executor.submit(make_dir, pair) for pair in dirs]):
+            try:
+                future.result()
+            except OSError as e:
+                errors.append((src, dst, str(e)))
+        
+        futures = {executor.submit(_fast_copy, src, dst): (src, dst) for src, dst in copies}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except OSError as e:
+                src, dst = futures[future]
+                errors.append((src, dst, str(e)))
+        
+        # Deepest directories first, so copying a parent's times comes last
+        for src, dst in reversed(dirs):
+            try:
+                shutil.copystat(src, dst)
+            except OSError as e:
+                errors.append((src, dst, str(e)))
+        
+        if errors:
+            raise shutil.Error(errors)
+    
+    def process_deepfreeze_folders(self, source_path: Path, destination_path: Path, subdirs: List[str]) -> int:
         """
         Process folders in DeepFreeze mode by moving them to a '_Folders' directory.
         
         Args:
             source_path: The source directory path
             destination_path: The destination directory path
+            subdirs: Names of the source's immediate subdirectories, collected
+                while the files were listed
             
         Returns:
             Number of directories processed
@@ -532,257 +1166,452 @@ class FileOrganizer:
         
         folders_moved = 0
         
-        # Find all immediate subdirectories in the source
-        for item in os.listdir(source_path):
+        # Same-filesystem moves are first submitted as one batch of renames;
+        # taken names and other failures go through the loop below
+        if (self.file_op.mode == OperationMode.MOVE and len(subdirs) >= MIN_BATCH_FOR_URING
+                and self.file_op.can_batch_renames(source_path, folders_dir)):
+            results = self.file_op.perform_batch([(source_path / item, folders_dir / item) for item in subdirs])
+            folders_moved = sum(results)
+            subdirs = [item for item, ok in zip(subdirs, results) if not ok]
+        
+        # Copies share one pool, so folder contents are copied in parallel
+        executor = ThreadPoolExecutor(max_workers=self.worker_count) if self.file_op.mode == OperationMode.COPY else None
+        
+        # Move each remaining immediate subdirectory of the source
+        for item in subdirs:
             item_path = source_path / item
             
-            if item_path.is_dir():
-                # Determine destination folder path
-                dest_folder = folders_dir / item
-                
-                # Handle duplicate folder names
+            # Determine destination folder path
+            dest_folder = folders_dir / item
+            claimed = False
+            
+            try:
+                # Claim the name by creating the folder, so a taken name
+                # shows up as FileExistsError instead of an exists() probe
                 counter = 1
-                original_name = item
-                while dest_folder.exists():
-                    new_name = f"{original_name}_{counter}"
-                    dest_folder = folders_dir / new_name
-                    counter += 1
+                while True:
+                    try:
+                        os.mkdir(dest_folder)
+                        claimed = True
+                        break
+                    except FileExistsError:
+                        dest_folder = folders_dir / f"{item}_{counter}"
+                        counter += 1
                 
-                try:
-                    # Move the folder and its contents
-                    if self.file_op.mode == OperationMode.MOVE:
+                # Move the folder and its contents
+                if self.file_op.mode == OperationMode.MOVE:
+                    try:
+                        # Replaces the empty placeholder in one step on POSIX
+                        os.rename(item_path, dest_folder)
+                    except OSError:
+                        # Across filesystems (or on Windows) free the name
+                        # for shutil.move, which copies into a new folder
+                        os.rmdir(dest_folder)
                         shutil.move(str(item_path), str(dest_folder))
-                    else:  # COPY mode
-                        shutil.copytree(str(item_path), str(dest_folder))
-                    
-                    # Log operation
-                    self.file_op.operations_log.append((item_path, dest_folder))
-                    
-                    folders_moved += 1
-                    logger.info(f"Successfully {self.file_op.mode.value}d folder {item_path} to {dest_folder}")
-                    
-                except Exception as e:
-                    logger.error(f"Failed to {self.file_op.mode.value} folder {item_path} to {dest_folder}: {e}")
-                    self.file_op.failed_operations.append((item_path, dest_folder, e))
+                else:  # COPY mode
+                    self._copy_tree(str(item_path), str(dest_folder), executor)
+                
+                # Log operation
+                self.file_op.log_operation(item_path, dest_folder)
+                
+                folders_moved += 1
+                logger.info(f"Successfully {self.file_op.mode.value}d folder {item_path} to {dest_folder}")
+                
+            except Exception as e:
+                logger.error(f"Failed to {self.file_op.mode.value} folder {item_path} to {dest_folder}: {e}")
+                self.file_op.note_failure(item_path, dest_folder, e)
+                if claimed:
+                    # Drop the placeholder if nothing was put in it
+                    try:
+                        os.rmdir(dest_folder)
+                    except OSError:
+                        pass
+        
+        if executor is not None:
+            executor.shutdown()
         
         logger.info(f"{self.file_op.mode.value.capitalize()}d {folders_moved} folders to {folders_dir}")
         return folders_moved
     
-    def get_file_extensions(self, files: List[Path]) -> Set[str]:
-        """Extract unique file extensions from a list of files."""
-        extensions = set()
+    def create_extension_directories(self, destination_path: Path,
+                                     extensions: Set[str]) -> Tuple[Dict[str, Path], Dict[str, str]]:
+        """
+        Create directories for each file extension.
         
-        for file in files:
-            # Get extension without the dot and convert to lowercase
-            ext = file.suffix[1:].lower() if file.suffix else "no_extension"
-            extensions.add(ext)
-            
-        logger.info(f"Found {len(extensions)} unique file extensions")
-        return extensions
-    
-    def create_extension_directories(self, destination_path: Path, extensions: Set[str]) -> Dict[str, Path]:
-        """Create directories for each file extension."""
+        process_files calls this as extensions are first seen, so each
+        directory is created once, right before the first file goes into it.
+        The destination already exists, so a single mkdir per directory is
+        enough. Larger sets are created from a small thread pool, since each
+        mkdir is a round trip to the filesystem (a slow one on network shares).
+        
+        Returns:
+            The created directories, and for each one its path as a string
+            ending in a separator, so file paths can be built by concatenation
+        """
         created_dirs = {}
+        dir_prefixes = {}
+        
+        def create(dir_path: Path) -> None:
+            try:
+                os.mkdir(dir_path)
+            except FileExistsError:
+                if not os.path.isdir(dir_path):
+                    raise
+        
+        def created(ext: str, dir_path: Path) -> None:
+            created_dirs[ext] = dir_path
+            dir_prefixes[ext] = os.fspath(dir_path) + os.sep
         
-        with self.ui_manager.create_progress_bar(len(extensions), "Creating directories") as pbar:
+        if len(extensions) <= MKDIR_POOL_THRESHOLD:
+            # Starting a pool costs more than a few mkdir calls
             for ext in extensions:
                 dir_path = destination_path / ext
                 try:
-                    os.makedirs(dir_path, exist_ok=True)
-                    created_dirs[ext] = dir_path
+                    create(dir_path)
+                    created(ext, dir_path)
                 except Exception as e:
                     logger.error(f"Error creating directory {dir_path}: {e}")
-                pbar.update(1)
+            return created_dirs, dir_prefixes
         
-        return created_dirs
+        with ThreadPoolExecutor(max_workers=min(8, len(extensions))) as executor:
+            futures = {executor.submit(create, destination_path / ext): ext for ext in extensions}
+            for future in as_completed(futures):
+                ext = futures[future]
+                dir_path = destination_path / ext
+                try:
+                    future.result()
+                    created(ext, dir_path)
+                except Exception as e:
+                    logger.error(f"Error creating directory {dir_path}: {e}")
+        
+        return created_dirs, dir_prefixes
     
-    def _process_file(self, file: Path, ext_dir: Path) -> Tuple[bool, Optional[Path]]:
-        """Process a single file (worker function)."""
+    def _process_file(self, source: str, dest_prefix: str, name: str) -> Tuple[bool, Optional[str]]:
+        """
+        Process a single file (worker function).
+        
+        Used for copies and for moves that cannot go through
+        _process_file_fast. perform_operation claims the destination name
+        atomically, so the plain name is tried first and a counter is only
+        added when it turns out to be taken.
+        """
         try:
-            # Normalize extension
-            ext = file.suffix[1:].lower() if file.suffix else "no_extension"
-            
-            # Generate destination path
-            dest_file = ext_dir / file.name
-            
-            # Handle name conflicts
+            dest_file = dest_prefix + name
             counter = 1
-            original_stem = file.stem
-            while dest_file.exists():
-                new_name = f"{original_stem}_{counter}{file.suffix}"
-                dest_file = ext_dir / new_name
-                counter += 1
-                
-            # Perform the file operation
-            success = self.file_op.perform_operation(file, dest_file)
-            
-            return success, dest_file
+            while True:
+                try:
+                    return self.file_op.perform_operation(source, dest_file), dest_file
+                except FileExistsError:
+                    original_stem, suffix = split_suffix(name)
+                    dest_file = f"{dest_prefix}{original_stem}_{counter}{suffix}"
+                    counter += 1
             
         except Exception as e:
-            logger.error(f"Error processing file {file}: {e}")
+            logger.error(f"Error processing file {source}: {e}")
             return False, None
     
-    def worker(self, pbar: tqdm) -> None:
-        """Worker thread for processing files."""
-        while not self.completion_event.is_set():
-            try:
-                # Get item from queue with timeout
-                item = self.work_queue.get(timeout=0.5)
-                
-                # Process the item
-                file, ext_dir = item
-                success, _ = self._process_file(file, ext_dir)
-                
-                # Update counters
-                with threading.Lock():
-                    if success:
-                        self.moved_files += 1
-                    else:
-                        self.skipped_files += 1
-                
-                # Update progress bar
-                pbar.update(1)
-                
-                # Mark task as done
-                self.work_queue.task_done()
-                
-            except queue.Empty:
-                # Queue is empty, nothing to do
-                continue
-            except Exception as e:
-                logger.error(f"Worker error: {e}")
-                with threading.Lock():
-                    self.skipped_files += 1
+    def _process_file_fast(self, source: str, dest_prefix: str, name: str) -> Optional[bool]:
+        """
+        Move a file within one filesystem using plain string paths (worker function).
+        
+        The same-device MOVE case of _process_file without building any Path
+        objects: the destination is the directory prefix (ending in a
+        separator) plus the name, claimed with a hard link, which fails
+        instead of overwriting when the name is taken.
+        
+        Returns:
+            True on success, False if the move failed, or None if the
+            filesystem does not support hard links and _process_file should
+            be used instead
+        """
+        try:
+            destination = dest_prefix + name
+            counter = 1
+            while True:
+                try:
+                    return self.file_op.perform_link_move(source, destination)
+                except FileExistsError:
+                    original_stem, suffix = split_suffix(name)
+                    destination = f"{dest_prefix}{original_stem}_{counter}{suffix}"
+                    counter += 1
+        except Exception as e:
+            logger.error(f"Error processing file {source}: {e}")
+            return False
     
-    def process_files(self, files: List[Path], extension_dirs: Dict[str, Path]) -> Tuple[int, int]:
-        """Process files using a thread pool and work queue."""
+    def _batch_rename(self, src_paths: List[str], names: List[str], ext_ids: array,
+                      dest_prefixes: List[str], pbar: tqdm) -> List[int]:
+        """Rename files through io_uring where possible and return the indices left to process."""
+        pairs = [(src_paths[i], dest_prefixes[ext_ids[i]] + names[i]) for i in range(len(src_paths))]
+        
+        results = self.file_op.perform_batch(pairs)
+        renamed = sum(results)
+        self.moved_files += renamed
+        pbar.update(renamed)
+        
+        # Name conflicts and any other failures take the regular path
+        return [i for i, ok in enumerate(results) if not ok]
+    
+    def process_files(self, files: Iterable[ScannedFile], destination_path: Path,
+                      created_dirs: Optional[Dict[int, int]] = None) -> Tuple[int, int]:
+        """
+        Process files as they are found, using a thread pool.
+        
+        Files are gathered into chunks of STREAM_CHUNK_SIZE and each chunk is
+        handed to one worker, so moving starts while the target is still
+        being listed and only a bounded number of chunks is held at once.
+        Extension directories are created when a chunk brings in extensions
+        that have not been seen yet. files_processed and extensions_found are
+        filled in along the way.
+        
+        Args:
+            files: The files to process, typically from iter_files_from_target
+            destination_path: The directory to create extension directories in
+            created_dirs: If given, receives the st_ino -> st_dev of each
+                extension directory as soon as it exists, for the walk's
+                skip_dirs
+        """
         # Reset counters
         self.moved_files = 0
         self.skipped_files = 0
-        self.completion_event.clear()
+        self.files_processed = 0
+        self.extensions_found = set()
         
-        # Create progress bar
+        # Create progress bar; the total is only known once the listing ends
         operation_name = "Moving" if self.file_op.mode == OperationMode.MOVE else "Copying"
-        pbar = self.ui_manager.create_progress_bar(len(files), f"{operation_name} files")
+        pbar = self.ui_manager.create_progress_bar(None, f"{operation_name} files")
         
-        try:
-            # Start worker threads
-            workers = []
-            for _ in range(self.worker_count):
-                thread = threading.Thread(target=self.worker, args=(pbar,), daemon=True)
-                thread.start()
-                workers.append(thread)
+        # Destination directories (as prefixes ending in a separator) in order
+        # of first appearance. Each chunk is laid out as parallel arrays:
+        # source path and name strings per file, plus an index into this table
+        ext_table: Dict[str, int] = {}
+        dest_prefixes: List[str] = []
+        in_flight = deque()
+        missing_dirs: Dict[str, int] = {}
+        
+        def process_chunk(src_paths: List[str], names: List[str], ext_ids: array) -> int:
+            """Process one chunk of files and return how many succeeded."""
+            done = 0
+            for i in range(len(src_paths)):
+                source = src_paths[i]
+                ext_id = ext_ids[i]
+                success = None
+                dest_prefix = dest_prefixes[ext_id]
+                if self.file_op.can_link_move(os.path.dirname(source), dest_prefix):
+                    success = self._process_file_fast(source, dest_prefix, names[i])
+                if success is None:
+                    success, _ = self._process_file(source, dest_prefix, names[i])
+                done += success
+            return done
+        
+        def collect() -> None:
+            """Wait for the oldest chunk in flight and tally its results."""
+            future, size = in_flight.popleft()
+            done = future.result()
+            self.moved_files += done
+            self.skipped_files += size - done
+            pbar.update(size)
+        
+        def dispatch(executor: ThreadPoolExecutor, chunk: List[ScannedFile]) -> None:
+            """Create any new extension directories, then hand the chunk to a worker."""
+            new_exts = {file.ext for file in chunk} - self.extensions_found
+            if new_exts:
+                self.extensions_found |= new_exts
+                _, dir_prefixes = self.create_extension_directories(destination_path, new_exts)
+                for ext, prefix in dir_prefixes.items():
+                    ext_table[ext] = len(dest_prefixes)
+                    dest_prefixes.append(prefix)
+                    if created_dirs is not None:
+                        try:
+                            st = os.stat(prefix)
+                            created_dirs[st.st_ino] = st.st_dev
+                        except OSError:
+                            pass
             
-            # Queue up all files for processing
-            for file in files:
-                ext = file.suffix[1:].lower() if file.suffix else "no_extension"
-                
-                # Skip if directory for this extension wasn't created
-                if ext not in extension_dirs:
-                    logger.warning(f"No directory for extension '{ext}', skipping {file.name}")
+            # Group the chunk by extension so each destination directory is
+            # worked on in one run (the sort is stable, so duplicate names
+            # are numbered in listing order as before)
+            chunk.sort(key=attrgetter("ext"))
+            
+            src_paths: List[str] = []
+            names: List[str] = []
+            ext_ids = array('i')
+            for file in chunk:
+                ext_id = ext_table.get(file.ext)
+                if ext_id is None:
+                    # Skip if directory for this extension wasn't created
+                    missing_dirs[file.ext] = missing_dirs.get(file.ext, 0) + 1
                     self.skipped_files += 1
                     pbar.update(1)
                     continue
-                    
-                # Add to processing queue
-                self.work_queue.put((file, extension_dirs[ext]))
+                src_paths.append(file.path)
+                names.append(file.name)
+                ext_ids.append(ext_id)
             
-            # Wait for completion
-            self.work_queue.join()
+            if not src_paths:
+                return
             
+            # Same-filesystem moves are first submitted as batched renames
+            if (len(src_paths) >= MIN_BATCH_FOR_URING
+                    and self.file_op.can_batch_renames(os.path.dirname(src_paths[0]), destination_path)):
+                pending = self._batch_rename(src_paths, names, ext_ids, dest_prefixes, pbar)
+                src_paths = [src_paths[i] for i in pending]
+                names = [names[i] for i in pending]
+                ext_ids = array('i', (ext_ids[i] for i in pending))
+                if not src_paths:
+                    return
+            
+            in_flight.append((executor.submit(process_chunk, src_paths, names, ext_ids), len(src_paths)))
+            # Keep the workers busy without queueing up the whole listing
+            while len(in_flight) > self.worker_count * 2:
+                collect()
+        
+        try:
+            with ThreadPoolExecutor(max_workers=self.worker_count) as executor:
+                # Results are tallied here as chunks finish, so the counters
+                # are only ever touched by this thread
+                chunk: List[ScannedFile] = []
+                for file in files:
+                    self.files_processed += 1
+                    chunk.append(file)
+                    if len(chunk) == STREAM_CHUNK_SIZE:
+                        dispatch(executor, chunk)
+                        chunk = []
+                if chunk:
+                    dispatch(executor, chunk)
+                while in_flight:
+                    collect()
         finally:
-            # Signal threads to exit and wait for them
-            self.completion_event.set()
-            for thread in workers:
-                thread.join(timeout=1.0)
-                
-            # Close progress bar
+            pbar.total = self.files_processed
+            pbar.refresh()
             pbar.close()
         
+        if pbar.disable:
+            # No bar was drawn, so report the totals once
+            print(f"{operation_name} files: {self.moved_files + self.skipped_files}/{self.files_processed} done")
+        
+        if missing_dirs:
+            logger.warning(
+                f"Skipped {sum(missing_dirs.values())} files with no destination directory "
+                f"(extensions: {', '.join(sorted(missing_dirs))})"
+            )
+        
+        return self.moved_files, self.skipped_files
+    
+    def plan_files(self, files: Iterable[ScannedFile]) -> Tuple[int, int]:
+        """
+        Count files and extensions for a dry run without changing anything.
+        
+        Fills in files_processed and extensions_found like process_files,
+        with every file counted as one that would be moved or copied.
+        """
+        self.skipped_files = 0
+        self.files_processed = 0
+        self.extensions_found = set()
+        
+        for file in files:
+            self.files_processed += 1
+            self.extensions_found.add(file.ext)
+        
+        self.moved_files = self.files_processed
         return self.moved_files, self.skipped_files
     
     def run(self, target_path: Path, destination_path: Path, operation_mode: OperationMode,
            sort_mode: SortMode, report_format: str) -> None:
         """Run the file organization process."""
-        try:
-            # Set operation mode and report format
-            self.file_op.mode = operation_mode
-            self.report_generator = ReportGenerator(output_format=report_format)
-            
-            # Get files from target directory
-            files = self.get_files_from_target(target_path, sort_mode)
-            
-            if not files:
-                print(f"{Fore.YELLOW}No files found in the target directory.{Style.RESET_ALL}")
-                return
+        # Log records are written above the progress bar instead of tearing through it
+        with logging_redirect_tqdm():
+            try:
+                # Set operation mode and report format
+                self.file_op.mode = operation_mode
+                self.worker_count = self.workers_override or self.choose_worker_count(target_path, destination_path)
+                logger.info(f"Using {self.worker_count} worker threads")
+                self.report_generator = ReportGenerator(output_format=report_format)
                 
-            self.files_processed = len(files)
-            print(f"{Fore.GREEN}Found {len(files)} files to organize.{Style.RESET_ALL}")
-            
-            # Get unique file extensions
-            self.extensions_found = self.get_file_extensions(files)
-            print(f"{Fore.GREEN}Found {len(self.extensions_found)} unique file extensions.{Style.RESET_ALL}")
-            
-            # Create directories for each extension
-            extension_dirs = self.create_extension_directories(destination_path, self.extensions_found)
-            
-            # Confirm destructive operations
-            if operation_mode == OperationMode.MOVE and self.files_processed > 0:
-                confirm = self.ui_manager.get_confirmation(
-                    f"You are about to move {self.files_processed} files from {target_path} to {destination_path}. Proceed?",
-                    default=False
-                )
-                if not confirm:
-                    print(f"{Fore.YELLOW}Operation cancelled by user.{Style.RESET_ALL}")
+                # Confirm destructive operations; with nothing to move there
+                # is nothing to confirm and the run reports no files found
+                if operation_mode == OperationMode.MOVE and self.confirm and not self.dry_run:
+                    count = self.quick_count(target_path, sort_mode)
+                    if count:
+                        count_text = f"{count}+" if count >= QUICK_COUNT_LIMIT else str(count)
+                        confirm = self.ui_manager.get_confirmation(
+                            f"You are about to move {count_text} files from {target_path} to {destination_path}. Proceed?",
+                            default=False
+                        )
+                        if not confirm:
+                            print(f"{Fore.YELLOW}Operation cancelled by user.{Style.RESET_ALL}")
+                            return
+                
+                # Process files as the target directory is listed
+                subdirs: List[str] = []
+                # Extension directories created during the listing are kept
+                # out of it, which matters when the target is the destination
+                created_dirs: Dict[int, int] = {}
+                files = self.iter_files_from_target(target_path, sort_mode, subdirs, exclude=destination_path,
+                                                    skip_dirs=created_dirs)
+                if self.dry_run:
+                    moved_files, skipped_files = self.plan_files(files)
+                else:
+                    moved_files, skipped_files = self.process_files(files, destination_path, created_dirs)
+                
+                if not self.files_processed:
+                    print(f"{Fore.YELLOW}No files found in the target directory.{Style.RESET_ALL}")
                     return
-            
-            # Process files
-            moved_files, skipped_files = self.process_files(files, extension_dirs)
-            
-            # Process folders if in DeepFreeze mode
-            folders_moved = 0
-            if sort_mode == SortMode.DEEPFREEZE:
-                print(f"{Fore.GREEN}Processing folders in DeepFreeze mode...{Style.RESET_ALL}")
-                folders_moved = self.process_deepfreeze_folders(target_path, destination_path)
-                if folders_moved > 0:
-                    print(f"{Fore.GREEN}Successfully {self.file_op.mode.value}d {folders_moved} folders to {destination_path / '_Folders'}{Style.RESET_ALL}")
-            
-            # Generate and display report
-            report = self.report_generator.generate_report(
-                files_processed=self.files_processed,
-                extensions_found=self.extensions_found,
-                moved_files=moved_files,
-                skipped_files=skipped_files,
-                destination_path=destination_path,
-                operation_mode=operation_mode,
-                sort_mode=sort_mode,
-                failed_operations=self.file_op.failed_operations,
-                folders_moved=folders_moved
-            )
-            
-            print(report)
-            
-            # Save config for next time
-            self.config.save_config(
-                target_path=target_path,
-                destination_path=destination_path,
-                operation_mode=operation_mode,
-                sort_mode=sort_mode,
-                report_format=report_format
-            )
-            
-        except Exception as e:
-            logger.error(f"Organization process failed: {e}")
-            print(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
-            
-            # Try to rollback if in move mode
-            if operation_mode == OperationMode.MOVE and self.file_op.operations_log:
-                print(f"{Fore.YELLOW}Attempting to rollback file moves...{Style.RESET_ALL}")
-                success, failed = self.file_op.rollback()
-                print(f"{Fore.GREEN}Successfully rolled back {success} operations.{Style.RESET_ALL}")
-                if failed > 0:
-                    print(f"{Fore.RED}Failed to roll back {failed} operations.{Style.RESET_ALL}")
-                    print(f"{Fore.RED}Some files may remain in the destination directory.{Style.RESET_ALL}")
+                
+                print(f"{Fore.GREEN}Found {self.files_processed} files to organize.{Style.RESET_ALL}")
+                logger.info(f"Found {len(self.extensions_found)} unique file extensions")
+                print(f"{Fore.GREEN}Found {len(self.extensions_found)} unique file extensions.{Style.RESET_ALL}")
+                
+                # Process folders if in DeepFreeze mode
+                folders_moved = 0
+                if sort_mode == SortMode.DEEPFREEZE and self.dry_run:
+                    folders_moved = len(subdirs)
+                elif sort_mode == SortMode.DEEPFREEZE:
+                    print(f"{Fore.GREEN}Processing folders in DeepFreeze mode...{Style.RESET_ALL}")
+                    folders_moved = self.process_deepfreeze_folders(target_path, destination_path, subdirs)
+                    if folders_moved > 0:
+                        print(f"{Fore.GREEN}Successfully {self.file_op.mode.value}d {folders_moved} folders to {destination_path / '_Folders'}{Style.RESET_ALL}")
+                
+                # Generate and display report
+                report = self.report_generator.generate_report(
+                    files_processed=self.files_processed,
+                    extensions_found=self.extensions_found,
+                    moved_files=moved_files,
+                    skipped_files=skipped_files,
+                    destination_path=destination_path,
+                    operation_mode=operation_mode,
+                    sort_mode=sort_mode,
+                    failed_operations=self.file_op.failed_operations,
+                    failed_count=self.file_op.failed_count,
+                    folders_moved=folders_moved
+                )
+                
+                print(report)
+                
+                if self.dry_run:
+                    operation_word = "moved" if operation_mode == OperationMode.MOVE else "copied"
+                    print(f"{Fore.YELLOW}Dry run: no files or folders were {operation_word}.{Style.RESET_ALL}")
+                
+                # Save config for next time
+                self.config.save_config(
+                    target_path=target_path,
+                    destination_path=destination_path,
+                    operation_mode=operation_mode,
+                    sort_mode=sort_mode,
+                    report_format=report_format
+                )
+                
+            except Exception as e:
+                logger.error(f"Organization process failed: {e}")
+                print(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
+                
+                # Try to rollback if in move mode
+                if operation_mode == OperationMode.MOVE and self.file_op.operations_log:
+                    print(f"{Fore.YELLOW}Attempting to rollback file moves...{Style.RESET_ALL}")
+                    success, failed = self.file_op.rollback()
+                    print(f"{Fore.GREEN}Successfully rolled back {success} operations.{Style.RESET_ALL}")
+                    if failed > 0:
+                        print(f"{Fore.RED}Failed to roll back {failed} operations.{Style.RESET_ALL}")
+                        print(f"{Fore.RED}Some files may remain in the destination directory.{Style.RESET_ALL}")
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -858,7 +1687,28 @@ def parse_arguments() -> argparse.Namespace:
         help="Enable DeepFreeze mode to organize files and move subdirectories to '_Folders'"
     )
     
-    return parser.parse_args()
+    parser.add_argument(
+        "-w", "--workers",
+        dest="workers",
+        type=int,
+        default=None,
+        help="Number of worker threads (default: chosen from the operation mode and destination disk)"
+    )
+    
+    parser.add_argument(
+        "--dry-run",
+        dest="dry_run",
+        action="store_true",
+        default=False,
+        help="List the files and report what would be done, without creating folders or moving/copying anything"
+    )
+    
+    args = parser.parse_args()
+    # Leaving -w out picks the count automatically; an explicit value must be usable
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+    
+    return args
 
 
 def main() -> None:
@@ -874,8 +1724,13 @@ def main() -> None:
     use_colors = not args.no_color and config.get_use_colors()
     ui_manager = UIManager(use_colors=use_colors)
     
+    # With both paths given, run as a script: no banner and no prompts for
+    # settings that have defaults (moves are still confirmed unless --no-confirm)
+    headless = bool(args.source_path and args.destination_path)
+    
     # Welcome message
-    ui_manager.print_welcome()
+    if not headless:
+        ui_manager.print_welcome()
     
     try:
         # Get source and destination paths
@@ -896,12 +1751,21 @@ def main() -> None:
             print(f"{Fore.CYAN}Default destination path: {default_dest}{Style.RESET_ALL}")
             destination_path = ui_manager.get_path_input("Enter destination directory path:", check_exists=False)
         
-        # Create destination directory if it doesn't exist
-        try:
-            os.makedirs(destination_path, exist_ok=True)
-        except Exception as e:
-            print(f"{Fore.RED}Error creating destination directory: {e}{Style.RESET_ALL}")
-            return
+        # Create destination directory if it doesn't exist (a dry run leaves
+        # it alone); one mkdir covers the usual cases, makedirs is only
+        # needed for missing parents
+        if not args.dry_run:
+            try:
+                try:
+                    os.mkdir(destination_path)
+                except FileExistsError:
+                    if not destination_path.is_dir():
+                        raise
+                except FileNotFoundError:
+                    os.makedirs(destination_path, exist_ok=True)
+            except Exception as e:
+                print(f"{Fore.RED}Error creating destination directory: {e}{Style.RESET_ALL}")
+                return
         
         # Get operation mode
         if args.operation_mode:
@@ -920,11 +1784,14 @@ def main() -> None:
             sort_mode = SortMode.DEEPFREEZE
         elif args.deep_sort:
             sort_mode = SortMode.DEEP
+        elif headless:
+            sort_mode = SortMode.NORMAL
         else:
             sort_mode = ui_manager.get_sort_mode()
         
         # Create and run the file organizer
-        organizer = FileOrganizer(ui_manager, config)
+        organizer = FileOrganizer(ui_manager, config, workers=args.workers, confirm=not args.no_confirm,
+                                  dry_run=args.dry_run)
         organizer.run(source_path, destination_path, operation_mode, sort_mode, report_format)
         
     except KeyboardInterrupt: